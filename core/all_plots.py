@@ -268,7 +268,8 @@ class ImagePlot(pg.GraphicsLayoutWidget):
 
         self.data_shape = [y_datashape, x_datashape]
 
-        self.data = np.full((self.data_shape[0],self.data_shape[1]),np.nan)
+        # float32 halves the bytes ImageItem converts on every setImage
+        self.data = np.full((self.data_shape[0],self.data_shape[1]),np.nan,dtype=np.float32)
 
         # Image plot panel
         self.image = pg.ImageItem(image = self.data)
@@ -300,17 +301,47 @@ class ImagePlot(pg.GraphicsLayoutWidget):
         self.h_line.sigPositionChanged.connect(self.update_roi_from_lines)
         self.v_line.sigPositionChanged.connect(self.update_roi_from_lines)
 
-        self.update_lines_from_roi()
-        self.update_roi_text()
+        # Drags emit many move signals per frame; collapse them into at
+        # most one ROI/line/label update every 16 ms.
+        self._pending_source = None
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
+
+        self._lines_from_roi()
 
 
     def update_lines_from_roi(self):
+        self._schedule_update('roi')
+
+    def update_roi_from_lines(self):
+        self._schedule_update('lines')
+
+    def _schedule_update(self, source):
+        self._pending_source = source
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _do_update(self):
+        source, self._pending_source = self._pending_source, None
+        if source == 'roi':
+            self._lines_from_roi()
+        elif source == 'lines':
+            self._roi_from_lines()
+
+    def _lines_from_roi(self):
         center = self.roi.pos() + self.roi.size() / 2
+        # Moving the lines would otherwise schedule a redundant roi update
+        self.h_line.blockSignals(True)
+        self.v_line.blockSignals(True)
         self.h_line.setPos(center.y())
         self.v_line.setPos(center.x())
+        self.h_line.blockSignals(False)
+        self.v_line.blockSignals(False)
         self.update_roi_text()
 
-    def update_roi_from_lines(self):
+    def _roi_from_lines(self):
         center = QtCore.QPointF(self.v_line.pos().x(), self.h_line.pos().y())
         size = self.roi.size()
         top_left = center - size / 2
@@ -442,7 +473,7 @@ class ImagePlot(pg.GraphicsLayoutWidget):
         if (np.isnan(self.data[-1,-1]))==0:
             
             self.is_full=True
-            self.data = np.full((self.data_shape[0],self.data_shape[1]),np.nan)
+            self.data = np.full((self.data_shape[0],self.data_shape[1]),np.nan,dtype=np.float32)
         current_y=current_target_index[self.x_level_number]
         current_x=current_target_index[self.y_level_number]
         reversed_current_target_index=[]
@@ -465,7 +496,7 @@ class ImagePlot(pg.GraphicsLayoutWidget):
         for idx in target_index:
             temp = temp[idx]
         
-        self.data = np.array(temp)
+        self.data = np.ascontiguousarray(temp, dtype=np.float32)
 
         # Final sanity check (optional, good for debugging)
         if self.data.ndim != 2:
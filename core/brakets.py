@@ -1,4 +1,5 @@
-import re
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -12,6 +13,10 @@ class Brakets:
 
     Destinations may be Python lists **or** NumPy arrays.
     Channel names are treated case-insensitively.
+
+    ``output`` is a C-ordered float64 array: rows = channels (contiguous),
+    cols = steps, NaN where a channel is idle.  Every fill writes a run of
+    consecutive columns in one row, i.e. along the contiguous axis.
     """
 
     # ------------------------------------------------------------------ #
@@ -30,8 +35,9 @@ class Brakets:
                             'F': [150]}
 
         # ---------- normalise destination table (upper-case keys) ----------
-        # Also coerce every value to a 1-D NumPy array for consistent length
-        self.destinations = {k.upper(): np.asarray(v).ravel()
+        # Also coerce every value to a 1-D float64 array for consistent length;
+        # matching the output dtype makes each leaf fill a plain slice copy
+        self.destinations = {k.upper(): np.asarray(v, dtype=np.float64).ravel()
                              for k, v in destinations.items()}
 
         # ---------- build / parse the command ------------------------------
@@ -47,12 +53,19 @@ class Brakets:
         # keep channel order exactly as it appears in the (now upper-case) dict
         self.all_channels = list(self.destinations.keys())
 
+        # ---------- plan (cached per command + channel lengths) -------------
+        signature = tuple((c, self._val_len(v)) for c, v in self.destinations.items())
+        total_cols, fills = _plan(_freeze(self.cmd), signature)
+
         # ---------- allocate output ----------------------------------------
-        total_cols = self._length(self.cmd, parallel=False)
-        self.output = np.full((len(self.all_channels), total_cols), np.nan)
+        self.output = np.empty((len(self.all_channels), total_cols),
+                               dtype=np.float64, order='C')
+        self.output.fill(np.nan)
 
         # ---------- fill ----------------------------------------------------
-        self._unpack(self.cmd, start_col=0, parallel=False)
+        for row, col, channel in fills:
+            vals = self.destinations[channel]
+            self.output[row, col:col + vals.size] = vals
 
     # ====================================================================== #
     #  Helpers
@@ -61,63 +74,84 @@ class Brakets:
     def _parse_plus_comma(text: str) -> list:
         """'A+B , c , d+E' → [['A','B'], 'c', ['d','E']]   (whitespace ignored)"""
         out: list = []
-        for chunk in re.split(r'\s*,\s*', text.strip()):
+        for chunk in text.split(','):
+            chunk = chunk.strip()
             if not chunk:
                 continue
-            parts = [p for p in re.split(r'\s*\+\s*', chunk) if p]
+            parts = [p.strip() for p in chunk.split('+') if p.strip()]
             out.append(parts if len(parts) > 1 else parts[0])
         return out
 
     @staticmethod
     def _upperise(node):
-        """Recursively turn every string leaf into upper-case."""
-        if isinstance(node, list):
-            return [Brakets._upperise(sub) for sub in node]
-        return node.upper()
+        """Turn every string leaf into upper-case (iterative, any nesting depth)."""
+        if not isinstance(node, list):
+            return node.upper()
+        root: list = []
+        stack = [(node, root)]
+        while stack:
+            src, dst = stack.pop()
+            for sub in src:
+                if isinstance(sub, list):
+                    dst.append([])
+                    stack.append((sub, dst[-1]))
+                else:
+                    dst.append(sub.upper())
+        return root
 
     # ------------------------------------------------------------------ #
     def _val_len(self, values: np.ndarray) -> int:
         """Length of a 1-D NumPy array (already flattened)."""
         return values.size
 
-    def _length(self, node, *, parallel: bool) -> int:
-        """Recursive column count."""
-        if isinstance(node, list):
-            if parallel:            # inner list ⇒ parallel: max
-                return max((self._length(sub, parallel=False) for sub in node),
-                           default=0)
-            # outer list ⇒ sequential: sum
-            return sum(self._length(sub,
-                                     parallel=isinstance(sub, list))
-                       for sub in node)
-
-        # single channel leaf
-        vals = self.destinations.get(node, np.asarray([]))
-        return self._val_len(vals)
+    @staticmethod
+    def _widths(tokens: tuple, sizes: dict) -> dict:
+        """Column count of every group in a frozen command, keyed by its _OPEN index.
+
+        Sequential groups sum their children, parallel groups take the widest
+        branch.  Groups inside a sequential group are parallel and vice versa;
+        the outermost group is sequential.  One pass over the flat tokens with
+        an explicit stack, so the cost is linear in the command size.
+        """
+        widths: dict = {}
+        # frame = [parallel, width so far, _OPEN index]; the base frame is
+        # parallel so the outermost group comes out sequential
+        stack = [[True, 0, None]]
+        for i, tok in enumerate(tokens):
+            if tok is _OPEN:
+                stack.append([not stack[-1][0], 0, i])
+                continue
+            if tok is _CLOSE:
+                _parallel, span, opened = stack.pop()
+                widths[opened] = span
+            else:
+                span = sizes.get(tok, 0)
+            frame = stack[-1]
+            frame[1] = max(frame[1], span) if frame[0] else frame[1] + span
+        widths[None] = stack[0][1]
+        return widths
 
     # ------------------------------------------------------------------ #
-    def _unpack(self, node, *, start_col: int, parallel: bool):
-        """Recursive writer into self.output."""
-        if isinstance(node, list):
-            if parallel:            # all branches share the same start_col
-                for sub in node:
-                    self._unpack(sub, start_col=start_col, parallel=False)
-            else:                   # sequential: walk the cursor
-                col = start_col
-                for sub in node:
-                    self._unpack(sub,
-                                 start_col=col,
-                                 parallel=isinstance(sub, list))
-                    col += self._length(sub,
-                                        parallel=isinstance(sub, list))
-        else:                       # single channel
-            vals = self.destinations.get(node)
-            if vals is None or vals.size == 0:
-                return                                # skip unknown / empty
-
-            row = self.all_channels.index(node)
-            n = self._val_len(vals)
-            self.output[row, start_col:start_col + n] = vals
+    @staticmethod
+    def _fills(tokens: tuple, widths: dict, sizes: dict) -> tuple:
+        """(row, start_col, channel) for every non-empty leaf, in write order."""
+        rows = {c: i for i, c in enumerate(sizes)}
+        fills = []
+        stack = [[True, 0]]                     # frame = [parallel, cursor]
+        for i, tok in enumerate(tokens):
+            if tok is _CLOSE:
+                stack.pop()
+                continue
+            frame = stack[-1]
+            col = frame[1]                      # parallel frames never advance
+            span = widths[i] if tok is _OPEN else sizes.get(tok, 0)
+            if not frame[0]:                    # sequential: walk the cursor
+                frame[1] += span
+            if tok is _OPEN:
+                stack.append([not frame[0], col])
+            elif span:                          # unknown / empty leaves are skipped
+                fills.append((rows[tok], col, tok))
+        return tuple(fills)
 
     # ====================================================================== #
     #  Convenience: pretty print
@@ -126,6 +160,45 @@ class Brakets:
         return f"Brakets(output=\n{self.output})"
 
 
+# ------------------------------------------------------------------------- #
+#  Plan cache
+# ------------------------------------------------------------------------- #
+_OPEN = object()    # group delimiters in a frozen command
+_CLOSE = object()
+
+
+def _freeze(node) -> tuple:
+    """Nested command lists → flat token tuple, usable as a cache key.
+
+    Groups become ``_OPEN, *children, _CLOSE``.  A flat tuple hashes and
+    compares without recursion, whatever the nesting depth of the command.
+    """
+    tokens = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, list):
+            tokens.append(_OPEN)
+            stack.append(_CLOSE)
+            stack.extend(reversed(item))
+        else:
+            tokens.append(item)
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=128)
+def _plan(tokens: tuple, signature: tuple) -> tuple:
+    """(total_cols, fills) for frozen command *tokens* and ((channel, length), ...).
+
+    The layout depends only on the command and on the channel order and
+    lengths, not on the values, so rebuilding a Brakets of the same shape
+    (e.g. after editing a setter's values) only copies the values.
+    """
+    sizes = dict(signature)
+    widths = Brakets._widths(tokens, sizes)
+    return widths[None], Brakets._fills(tokens, widths, sizes)
+
+
 # ------------------------------------------------------------------------- #
 #  Demos
 # ------------------------------------------------------------------------- #
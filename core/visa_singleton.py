@@ -0,0 +1,22 @@
+"""Process-wide ``pyvisa.ResourceManager`` shared by all device widgets."""
+
+import threading
+
+import pyvisa
+
+_rm = None
+_rm_lock = threading.Lock()
+
+
+def get_rm():
+    """Return the shared ResourceManager, creating it on first use.
+
+    Loading the VISA library is slow, and ``start_zmeter.create_equipment``
+    builds several device widgets that each need the resource list; they all
+    reuse this one instance.  Do not ``close()`` it from a device driver.
+    """
+    global _rm
+    with _rm_lock:
+        if _rm is None:
+            _rm = pyvisa.ResourceManager()
+        return _rm
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import os
 import sys
 import time
 from typing import Any
 
-import pyvisa  # type: ignore
 from PyQt6 import QtWidgets, QtCore, uic  # type: ignore
 
+try:
+    from core.visa_singleton import get_rm
+except ModuleNotFoundError:
+    _repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    if _repo_root not in sys.path:
+        sys.path.insert(0, _repo_root)
+    from core.visa_singleton import get_rm
+
 from demoDevice_logic import DemoDeviceLogic
 
+# compiled once at import; every DemoDevice() only runs setupUi.  The path is
+# resolved next to this file, not the cwd.
+_Ui_DemoDevice, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "demoDevice.ui"))
+
 
-class DemoDevice(QtWidgets.QWidget):
+class DemoDevice(QtWidgets.QWidget, _Ui_DemoDevice):
     """Qt GUI wrapper for the *Demo Device*.
 
     This is a template for a new device. The design intentionally follows the style of *sr860_main.SR860*.
@@ -21,12 +33,17 @@ class DemoDevice(QtWidgets.QWidget):
     stop_signal = QtCore.pyqtSignal()
     start_signal = QtCore.pyqtSignal()
 
+    # shared by all instances: one bus enumeration reused for RESOURCES_TTL seconds
+    RESOURCES_TTL = 5.0
+    _resources: tuple = ()
+    _resources_ts = float("-inf")
+
     # -------------------------------------------------------------
     def __init__(self) -> None:
         super().__init__()
 
-        # ---------------- load UI from external .ui file ---------------
-        uic.loadUi("demoDevice/demoDevice.ui", self)
+        # ---------------- build UI (form class generated from the .ui file) ---------------
+        self.setupUi(self)
 
         # ---------------- logic layer -------------
         self.logic = DemoDeviceLogic()
@@ -119,10 +136,13 @@ class DemoDevice(QtWidgets.QWidget):
     # Helper methods
     # -------------------------------------------------------------
     def _refresh_visa_resources(self):
-        rm = pyvisa.ResourceManager()
-        resources = rm.list_resources()
+        cls = type(self)
+        now = time.monotonic()
+        if now - cls._resources_ts > cls.RESOURCES_TTL:
+            cls._resources = tuple(get_rm().list_resources())
+            cls._resources_ts = now
         self.address_comboBox.clear()  # type: ignore[attr-defined]
-        self.address_comboBox.addItems(resources)  # type: ignore[attr-defined]
+        self.address_comboBox.addItems(cls._resources)  # type: ignore[attr-defined]
 
     # -------------------------------------------------------------
     # Periodic monitor
@@ -4,7 +4,7 @@ import time
 from typing import Any
 import numpy as np
 import pyqtgraph as pg
-import pyvisa  # type: ignore
+from core.visa_singleton import get_rm
 
 
 from .hp34401a_logic import HP34401A_Logic
@@ -38,8 +38,7 @@ class HP34401A(QtWidgets.QWidget):
         self.graph_dc_voltage.addWidget(w)
 
         # ----- VISA resource list -----
-        resource_manager = pyvisa.ResourceManager()
-        self.address_comboBox.addItems(resource_manager.list_resources())
+        self.address_comboBox.addItems(get_rm().list_resources())
 
         # ---------------- logic layer -------------
         self.logic = HP34401A_Logic()
@@ -182,8 +181,7 @@ class HP34401A(QtWidgets.QWidget):
     # Helper methods
     # -------------------------------------------------------------
     def _refresh_visa_resources(self):
-        rm = pyvisa.ResourceManager()
-        resources = rm.list_resources()
+        resources = get_rm().list_resources()
         self.address_comboBox.clear()  # type: ignore[attr-defined]
         self.address_comboBox.addItems(resources)  # type: ignore[attr-defined]
 
@@ -3,7 +3,7 @@ import sys
 from keithley24xx.keithley24xx_logic import Keithley24xxLogic
 import numpy as np
 import pyqtgraph as pg
-import pyvisa
+from core.visa_singleton import get_rm
 import time
 
 
@@ -14,8 +14,7 @@ class Keithley24xx(QtWidgets.QWidget):
         self.logic = Keithley24xxLogic()
         self.connect_sig_slot()
         self.is_connected = False
-        resource_manager = pyvisa.ResourceManager()
-        ls = resource_manager.list_resources()
+        ls = get_rm().list_resources()
         self.address_cb.addItems(ls)
         self.ramp_rate_label.setText(
             f"Current ramp rate: {self.logic.ramp_rate:.2e} V/s"
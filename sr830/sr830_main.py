@@ -4,7 +4,7 @@ import sys
 from sr830.sr830_logic import SR830_Logic
 import numpy as np
 import pyqtgraph as pg
-import pyvisa
+from core.visa_singleton import get_rm
 
 
 class SR830(QtWidgets.QWidget):
@@ -15,8 +15,7 @@ class SR830(QtWidgets.QWidget):
         uic.loadUi("sr830/sr830.ui", self)
         w = pg.GraphicsLayoutWidget(show=True)
         w.viewport().setAttribute(QtCore.Qt.WidgetAttribute.WA_AcceptTouchEvents, False)
-        resource_manager = pyvisa.ResourceManager()
-        ls = resource_manager.list_resources()
+        ls = get_rm().list_resources()
         self.address_cb.addItems(ls)
         self.plot_x = w.addPlot(row=0, col=0)
         self.plot_y = w.addPlot(row=1, col=0)
@@ -1,6 +1,9 @@
 import logging
+import math
 import time
-import pyvisa
+from core.visa_singleton import get_rm
+
+log = logging.getLogger(__name__)
 
 
 class SR860_Hardware:
@@ -15,19 +18,18 @@ class SR860_Hardware:
         address : VISA resource string, e.g. 'GPIB0::12::INSTR'
         """
         self._address = address
-        rm = pyvisa.ResourceManager()
-        self._vi = rm.open_resource(self._address)
+        self._vi = get_rm().open_resource(self._address)
         self._vi.write_termination = '\n'
         self._vi.read_termination = '\n'
         self._vi.timeout = 100
 
     # -------------- low-level helpers ---------------
     def _write(self, cmd: str):
-        logging.debug(f"→ {cmd}")
+        log.debug("→ %s", cmd)
         self._vi.write(cmd)
 
     def _query(self, cmd: str) -> str:
-        logging.debug(f"? {cmd}")
+        log.debug("? %s", cmd)
         
         count = 0
         while count < 3:
@@ -35,9 +37,9 @@ class SR860_Hardware:
                 return self._vi.query(cmd).strip()
             except Exception as e:
                 count += 1
-                print(f"Error querying {cmd}, trying again {count} times")
+                log.warning("Error querying %s, trying again %d times", cmd, count)
                 time.sleep(0.01)
-        print(f"Error querying {cmd}")
+        log.error("Error querying %s", cmd)
         return None
 
     # -------------- identity / reset ----------------
@@ -502,13 +504,22 @@ class SR860_Hardware:
         if len(args) > 3:
             raise ValueError("At most 3 arguments are allowed")
 
-        return self._query(f"SNAP? {','.join(args)}")
+        return self._query(f"SNAP? {','.join(self._ch_map[arg] for arg in args)}")
 
 
     def get_multiple_outputs(self, *args: str):
         time.sleep(0.001)
         return {arg: float(x) for arg, x in zip(args, self._snap_output(*args).split(","))}
 
+    def get_XYRT(self):
+        """X, Y, R, θ from one simultaneous SNAP? X,Y,TH round-trip.
+
+        SNAP? takes at most three parameters, so R is computed from the
+        same X/Y snapshot instead of costing a fourth query.
+        """
+        x, y, theta = (float(v) for v in self._snap_output("X", "Y", "Theta").split(","))
+        return x, y, math.hypot(x, y), theta
+
     def _snap_display(self):
         return self._query("SNAPD?")
 
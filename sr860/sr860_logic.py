@@ -1,11 +1,14 @@
 from PyQt6 import QtCore
-import time
+import logging
+import threading
 
 from .sr860_hardware import SR860_Hardware
 
+log = logging.getLogger(__name__)
 
-class SR860_Logic(QtCore.QThread):
-    """Qt thread-wrapper that exposes **all** SR860_Hardware methods via signals.
+
+class SR860_Logic(QtCore.QObject):
+    """QObject run on a worker thread that exposes **all** SR860_Hardware methods via signals.
 
     Naming rules (enforced project-wide):
     1. get_xxx   – purely read access; proxies <hardware>.xxx(read=True) or <hardware>.get_xxx().
@@ -13,21 +16,27 @@ class SR860_Logic(QtCore.QThread):
     3. setup_xxx  – boolean two-state helpers (ON / OFF like auto_range, sync_filter …).
     4. get_xxx    - get_X, get_Y, get_R, get_Theta and get_aux_in to be used as getters in scan control.
 
-    The QThread processes queued jobs.  The *job* string **must exactly match** the wrapper
-    method name so the dispatcher can automatically call it.
+    The object lives on a dedicated I/O thread (``moveToThread``) and processes jobs
+    posted to it.  The *job* string **must exactly match** the wrapper method name so the
+    dispatcher can automatically call it.  Jobs are handed over with
+    ``submit(job, **setpoints)``, which emits a signal queued to the ``run_job``
+    slot; Qt's event queue serialises them, so VISA traffic never
+    blocks the GUI thread and no start/stop bursts are needed.
     """
 
     # ---------- value update signals ----------
-    sig_frequency = QtCore.pyqtSignal(object)
-    sig_amplitude = QtCore.pyqtSignal(object)
+    # numeric / boolean values are typed so Qt marshals them natively; the
+    # enumerated settings stay *object* (label string, index or None)
+    sig_frequency = QtCore.pyqtSignal(float)
+    sig_amplitude = QtCore.pyqtSignal(float)
     sig_time_constant = QtCore.pyqtSignal(object)
     sig_sensitivity = QtCore.pyqtSignal(object)
-    sig_phase = QtCore.pyqtSignal(object)
+    sig_phase = QtCore.pyqtSignal(float)
     sig_ref_mode = QtCore.pyqtSignal(object)
     sig_ext_trigger = QtCore.pyqtSignal(object)
     sig_ref_input = QtCore.pyqtSignal(object)
-    sig_sync_filter = QtCore.pyqtSignal(object)
-    sig_harmonic = QtCore.pyqtSignal(object)
+    sig_sync_filter = QtCore.pyqtSignal(bool)
+    sig_harmonic = QtCore.pyqtSignal(int)
     sig_signal_input_type = QtCore.pyqtSignal(object)
     sig_signal_input_mode = QtCore.pyqtSignal(object)
     sig_input_config = QtCore.pyqtSignal(object)
@@ -35,33 +44,39 @@ class SR860_Logic(QtCore.QThread):
     sig_voltage_input_range = QtCore.pyqtSignal(object)
     sig_current_input_range = QtCore.pyqtSignal(object)
     sig_input_shield = QtCore.pyqtSignal(object)
-    sig_dc_level = QtCore.pyqtSignal(object)
+    sig_dc_level = QtCore.pyqtSignal(float)
     sig_dc_level_mode = QtCore.pyqtSignal(object)
     sig_filter_slope = QtCore.pyqtSignal(object)
 
-    sig_X = QtCore.pyqtSignal(object)
-    sig_Y = QtCore.pyqtSignal(object)
-    sig_R = QtCore.pyqtSignal(object)
-    sig_Theta = QtCore.pyqtSignal(object)
+    sig_X = QtCore.pyqtSignal(float)
+    sig_Y = QtCore.pyqtSignal(float)
+    sig_R = QtCore.pyqtSignal(float)
+    sig_Theta = QtCore.pyqtSignal(float)
+    sig_XYRT = QtCore.pyqtSignal(float, float, float, float)  # one sample of all four streams
 
     sig_display = QtCore.pyqtSignal(object)
     sig_aux_out = QtCore.pyqtSignal(object)        # (chan, value)
     sig_aux_in = QtCore.pyqtSignal(object)         # (chan, value)
-    sig_unlocked = QtCore.pyqtSignal(object)
-    sig_input_overload = QtCore.pyqtSignal(object)
-    sig_sensitivity_overload = QtCore.pyqtSignal(object)
+    sig_unlocked = QtCore.pyqtSignal(bool)
+    sig_input_overload = QtCore.pyqtSignal(bool)
+    sig_sensitivity_overload = QtCore.pyqtSignal(bool)
     sig_multiple_outputs = QtCore.pyqtSignal(object)
+    sig_all_state = QtCore.pyqtSignal(dict)  # {name: value} batch from get_all
 
     # ---------- generic state signals ----------
     sig_is_changing = QtCore.pyqtSignal(object)
     sig_connected = QtCore.pyqtSignal(object)
+    sig_job_done = QtCore.pyqtSignal(str)  # emitted after every job, successful or not
+    _sig_job = QtCore.pyqtSignal(str, object)  # (job, setpoints), queued to run_job
 
     # -------------------------------------------
     def __init__(self):
         super().__init__()
 
-        # queued instruction executed in run()
-        self.job: str = ""  # name of the next action
+        # queued instructions executed in run_job()
+        self.job: str = ""  # name of the action currently being executed
+        self._io_lock = threading.Lock()  # serialises jobs with disconnect()
+        self._sig_job.connect(self.run_job, QtCore.Qt.ConnectionType.QueuedConnection)
 
         # -------- set-points (set_*) --------
         self.setpoint_frequency = 0.0
@@ -98,10 +113,16 @@ class SR860_Logic(QtCore.QThread):
 
         # runtime state
         self.connected = False
-        self.reject_signal = False
 
         self.hardware: SR860_Hardware | None = None
 
+        # job name -> bound wrapper, resolved once instead of per job
+        self._job_table = {
+            name: getattr(self, name)
+            for name in dir(type(self))
+            if name.startswith(("get_", "set_")) and callable(getattr(self, name))
+        }
+
     # -------------- connection helpers ----------------
     def connect_visa(self, address: str):
         """Instantiate SR860_Hardware and open VISA connection."""
@@ -183,17 +204,20 @@ class SR860_Logic(QtCore.QThread):
         return val
 
     def get_input_config(self):
+        val = self._read_input_config()
+        self.sig_input_config.emit(val)
+        return val
+
+    def _read_input_config(self):
         assert self.hardware is not None
         input_type = self.hardware.signal_input_type(read=True)
         input_mode = self.hardware.signal_input_mode(read=True)
         if input_type == "voltage":
-            val = f"Voltage: {input_mode}"
+            return f"Voltage: {input_mode}"
         elif input_type == "current":
-            val = f"Current"
+            return f"Current"
         else:
             raise ValueError(f"Invalid signal input type: {input_type}")
-        self.sig_input_config.emit(val)
-        return val
 
     def get_voltage_input_coupling(self):
         assert self.hardware is not None
@@ -480,85 +504,90 @@ class SR860_Logic(QtCore.QThread):
 
     # -------------- bulk helper ------------------------
     def get_all(self):
-        """Read a representative subset of parameters at once."""
-
-        self.get_input_overload()
-        self.get_sensitivity_overload()
-        self.get_X()
-        self.get_Y()
-        self.get_R()
-        self.get_Theta()
-
-        # --- always refresh current input configuration and ranges ---
-
-        # self.get_display()
-        # self.get_unlocked()
-
-        self.monitor_count += 1
-        if self.monitor_count >= 10:
-            self.get_frequency()
-            self.get_amplitude()
-            self.get_time_constant()
-            self.get_sensitivity()
-            self.get_phase()
-            self.get_ref_mode()
-            self.get_ext_trigger()
-            self.get_ref_input()
-            self.get_sync_filter()
-            self.get_harmonic()
-            self.get_voltage_input_coupling()
-            self.get_input_config()
-            self.get_voltage_input_range()
-            self.get_current_input_range()
-            self.get_input_shield()
-            self.monitor_count = 0
-        time.sleep(0.05)
+        """Read a representative subset of parameters at once.
+
+        X/Y/R/Theta go out on *sig_XYRT*; every other value read here is
+        collected into one {name: value} dict and emitted on *sig_all_state*
+        (also when a read fails half-way, with whatever was read so far).
+        """
+        assert self.hardware is not None
+        hw = self.hardware
+        state = {}
+        try:
+            state["input_overload"] = hw.input_overload()
+            state["sensitivity_overload"] = hw.sensitivity_overload()
+            self.sig_XYRT.emit(*hw.get_XYRT())
+
+            # --- always refresh current input configuration and ranges ---
+
+            # self.get_display()
+            # self.get_unlocked()
+
+            self.monitor_count += 1
+            if self.monitor_count >= 10:
+                state["frequency"] = hw.get_frequency()
+                state["amplitude"] = hw.get_amplitude()
+                state["time_constant"] = hw.time_constant(read=True)
+                state["sensitivity"] = hw.sensitivity(read=True)
+                state["phase"] = hw.phase(read=True)
+                state["ref_mode"] = hw.ref_mode(read=True)
+                state["ext_trigger"] = hw.ext_trigger(read=True)
+                state["ref_input"] = hw.ref_input(read=True)
+                state["sync_filter"] = hw.sync_filter(read=True)
+                state["harmonic"] = hw.harmonic(read=True)
+                state["voltage_input_coupling"] = hw.voltage_input_coupling(read=True)
+                state["input_config"] = self._read_input_config()
+                state["voltage_input_range"] = hw.voltage_input_range(read=True)
+                state["current_input_range"] = hw.current_input_range(read=True)
+                state["input_shield"] = hw.input_shield(read=True)
+                self.monitor_count = 0
+        finally:
+            if state:
+                self.sig_all_state.emit(state)
+
+    # -------------- job queue -------------------------
+    def submit(self, job: str, **setpoints):
+        """Post *job* to the I/O thread; *setpoints* are applied there right before it runs."""
+        self._sig_job.emit(job, setpoints)
 
     # -------------- disconnect helper ------------------
     def disconnect(self):
-        """Safely stop the thread and close the VISA link."""
-        self.reject_signal = True
-        self.job = ""
-
-        if self.isRunning():
-            self.wait()
-
-        if self.hardware is not None:
-            try:
-                self.hardware.disconnect()
-            except Exception as exc:
-                print("[WARN] Error during hardware.disconnect():", exc)
-            self.hardware = None
-
-        if self.connected:
-            self.connected = False
-            self.sig_connected.emit("disconnected")
-
-        # allow new jobs after a future reconnect
-        self.reject_signal = False
-
-    # -------------- thread main ------------------------
-    def run(self):
-        if self.reject_signal or not self.connected or self.hardware is None:
-            return
-
-        # generic dispatcher: call method named in self.job (no args)
-        if self.job:
-            fn = getattr(self, self.job, None)
-            if callable(fn):
+        """Close the VISA link once the job in progress (if any) has finished."""
+        with self._io_lock:
+            if self.hardware is not None:
                 try:
-                    fn()
+                    self.hardware.disconnect()
                 except Exception as exc:
-                    print(f"[WARN] SR860_Logic job '{self.job}' error:", exc)
-            else:
-                print(f"[WARN] SR860_Logic has no job '{self.job}'")
-
-            # reset marker
-            self.job = ""
-
-    # -------------- stop helper ------------------------
-    def stop(self):
-        self.reject_signal = True
-        self.quit()
-        self.wait()
-        self.reject_signal = False
\ No newline at end of file
+                    log.warning("Error during hardware.disconnect(): %s", exc)
+                self.hardware = None
+
+            if self.connected:
+                self.connected = False
+                self.sig_connected.emit("disconnected")
+
+    # -------------- job slot ---------------------------
+    @QtCore.pyqtSlot(str, object)
+    def run_job(self, job: str, setpoints: dict):
+        try:
+            with self._io_lock:
+                if not self.connected or self.hardware is None:
+                    return
+
+                for name, value in setpoints.items():
+                    setattr(self, name, value)
+
+                # generic dispatcher: call method named in job (no args)
+                self.job = job
+                fn = self._job_table.get(job)
+                if fn is not None:
+                    try:
+                        fn()
+                    except Exception as exc:
+                        log.warning("SR860_Logic job '%s' error: %s", job, exc)
+                else:
+                    log.warning("SR860_Logic has no job '%s'", job)
+
+                # reset marker
+                self.job = ""
+        finally:
+            self.sig_job_done.emit(job)
@@ -1,57 +1,166 @@
-from PyQt6 import QtWidgets, uic, QtCore
+from PyQt6 import QtWidgets, uic, QtCore, sip
+import logging
+import os
 import sys
+from functools import partial
 import time
 import numpy as np
 import pyqtgraph as pg
-import pyvisa
 
+try:
+    import OpenGL  # noqa: F401  (PyOpenGL is optional; enables GPU curve drawing)
+    _HAVE_OPENGL = True
+except ImportError:
+    _HAVE_OPENGL = False
+
+from core.visa_singleton import get_rm
 from .sr860_logic import SR860_Logic
 
+log = logging.getLogger(__name__)
+
+# compiled once at import (SR860 derives from the form class); every SR860()
+# only runs setupUi.  The path is resolved next to this file, not the cwd.
+_Ui_SR860, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), "sr860.ui"))
+
+# widget kind -> (read widget, show value, cast set-point, change signal)
+# numeric/boolean logic signals are typed, so only combos need a conversion
+_WIDGET_KINDS = {
+    "dspin": (lambda w: w.value(), lambda w, v: w.setValue(v), float, "valueChanged"),
+    "spin": (lambda w: w.value(), lambda w, v: w.setValue(v), int, "valueChanged"),
+    "combo": (lambda w: w.currentIndex(), lambda w, v: w.setCurrentText(str(v)), int, "currentIndexChanged"),
+    "check": (lambda w: w.isChecked(), lambda w, v: w.setChecked(v), bool, "stateChanged"),
+    "led": (lambda w: w.isChecked(), lambda w, v: w.setChecked(v), bool, "toggled"),
+}
+
+# units of the sensitivity labels, e.g. "500 mV [nA]" (voltage [current] full scale)
+_SCALE_UNITS = {
+    "V": 1.0, "mV": 1e-3, "uV": 1e-6, "nV": 1e-9,
+    "uA": 1e-6, "nA": 1e-9, "pA": 1e-12, "fA": 1e-15,
+}
 
-class SR860(QtWidgets.QWidget):
+
+class SR860(QtWidgets.QWidget, _Ui_SR860):
     """Qt GUI wrapper for SR860 lock-in amplifier.
 
     The class is heavily inspired by *sr830_main.SR830* but follows the
     new **sr860_logic** naming rules (get_*/set_*).  Where the
     corresponding method is missing on *SR860_Logic*, a stub is provided
     that simply *pass*es so UI connections still resolve.
+
+    Plain widget <-> set-point parameters are declared once in *SPEC* /
+    *READBACK_SPEC*; their set_*/get_* wrappers are generated in ``__init__``
+    and every update_* goes through the (widget, show) table used by *_apply*.
+
+    ``SR860(use_opengl=True)`` draws the live plots through OpenGL when
+    PyOpenGL is installed; it is off by default because it needs a global
+    pyqtgraph option that affects every plot in the application.
     """
 
     stop_signal = QtCore.pyqtSignal()
     start_signal = QtCore.pyqtSignal()
 
-    def __init__(self):
+    # (name, widget, widget kind, logic signal) -> set_<name>, get_<name>, update_<name>
+    SPEC = [
+        ("frequency", "freq_doubleSpinBox", "dspin", "sig_frequency"),
+        ("amplitude", "ampl_doubleSpinBox", "dspin", "sig_amplitude"),
+        ("time_constant", "time_constant_comboBox", "combo", "sig_time_constant"),
+        ("sensitivity", "sensitivity_comboBox", "combo", "sig_sensitivity"),
+        ("phase", "phase_doubleSpinBox", "dspin", "sig_phase"),
+        ("ref_mode", "ref_mode_comboBox", "combo", "sig_ref_mode"),
+        ("ext_trigger", "trig_comboBox", "combo", "sig_ext_trigger"),
+        ("ref_input", "ext_ref_comboBox", "combo", None),
+        ("sync_filter", "sync_filter_checkBox", "check", "sig_sync_filter"),
+        ("harmonic", "harmonic_spinBox", "spin", "sig_harmonic"),
+        ("voltage_input_coupling", "input_coupling_comboBox", "combo", "sig_voltage_input_coupling"),
+        ("input_shield", "input_shield_comboBox", "combo", "sig_input_shield"),
+        ("dc_level", "dclevel_doubleSpinBox", "dspin", "sig_dc_level"),
+        ("dc_level_mode", "dclevel_mode_comboBox", "combo", "sig_dc_level_mode"),
+        ("filter_slope", "filter_slope_comboBox", "combo", "sig_filter_slope"),
+    ]
+    # read-back only -> get_<name>, update_<name>
+    READBACK_SPEC = [
+        ("voltage_input_range", "voltage_range_comboBox", "combo", "sig_voltage_input_range"),
+        ("current_input_range", "current_range_comboBox", "combo", "sig_current_input_range"),
+        ("unlocked", "unlocked_radioButton", "led", "sig_unlocked"),
+        ("input_overload", "input_ovld_radioButton", "led", "sig_input_overload"),
+        ("sensitivity_overload", "sens_ovld_radioButton", "led", "sig_sensitivity_overload"),
+    ]
+
+    def __init__(self, use_opengl: bool = False):
         super().__init__()
 
         # ----- load UI -----
-        uic.loadUi("sr860/sr860.ui", self)
+        self.setupUi(self)
 
         # ----- helper plot widget (X, Y, R, Theta streams) -----
+        # X and Y share a unit and a full scale, so they share one ViewBox;
+        # R and Theta keep their own axes (three ViewBoxes instead of four)
         w = pg.GraphicsLayoutWidget(show=True)
         w.viewport().setAttribute(QtCore.Qt.WidgetAttribute.WA_AcceptTouchEvents, False)
-        self.plot_x = w.addPlot(row=0, col=0)
-        self.plot_y = w.addPlot(row=1, col=0)
+        self.plot_xy = w.addPlot(row=0, col=0, rowspan=2)
         self.plot_r = w.addPlot(row=0, col=1)
         self.plot_t = w.addPlot(row=1, col=1)
-        self.plot_x.setTitle("X")
-        self.plot_y.setTitle("Y")
+        self.plot_xy.setTitle("X, Y")
+        self.plot_xy.addLegend(offset=(5, 5))
         self.plot_r.setTitle("R")
         self.plot_t.setTitle("Theta")
+        # streaming plots use a fixed window: no mouse, no per-update autorange.
+        # X/Y/R follow the instrument sensitivity once it is known (until then
+        # *rescale_timer* fits them to the data); Theta always spans ±180°
+        w.setAntialiasing(False)
+        if use_opengl and _HAVE_OPENGL:
+            # opt-in only: curves draw as GL line strips with pyqtgraph's
+            # *global* enableExperimental option, which also switches the
+            # QPainterPath builder of every other plot in the process
+            pg.setConfigOption("enableExperimental", True)
+            w.useOpenGL(True)
+        for plot in (self.plot_xy, self.plot_r, self.plot_t):
+            plot.setMouseEnabled(x=False, y=False)
+            plot.enableAutoRange(enable=False)
+            plot.setClipToView(True)
+            plot.setXRange(0, 199, padding=0)
+        self.plot_t.setYRange(-180, 180, padding=0)
         # *graph_xyrt* is a QVBoxLayout placeholder defined in the .ui file
         self.graph_xyrt.addWidget(w)
 
-        # ----- VISA resource list -----
-        resource_manager = pyvisa.ResourceManager()
-        self.address_cb.addItems(resource_manager.list_resources())
+        # ----- VISA resource list (bus probe runs on a pool thread) -----
+        QtCore.QThreadPool.globalInstance().start(self._list_addresses)
 
         # ----- logic / model layer -----
         self.logic = SR860_Logic()
-
-        # circular buffers for live plot
-        self.x_log = np.full(200, np.nan, dtype=float)
-        self.y_log = np.full(200, np.nan, dtype=float)
-        self.r_log = np.full(200, np.nan, dtype=float)
-        self.t_log = np.full(200, np.nan, dtype=float)
+        # all VISA I/O runs on this thread; jobs reach it through a queued signal
+        self._io_thread = QtCore.QThread(self)
+        self.logic.moveToThread(self._io_thread)
+        self._io_thread.start()
+        # embedded widgets get no closeEvent; stop the thread before Qt tears down
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.terminate_dev)
+
+        # live-plot buffers: one (4, 400) block, one row per stream, twice the
+        # 200-sample window.  Samples are appended at a per-stream head; when a
+        # row fills up its newest half is moved to the front, so the window is
+        # always the contiguous view buf[head - 200:head] and needs no copy.
+        self._window = 200
+        self._logs = np.empty((4, 2 * self._window), dtype=np.float32)
+        self.x_log, self.y_log, self.r_log, self.t_log = self._logs
+        self._heads = [0, 0, 0, 0]
+        self._xs = np.arange(self._window)  # newest sample sits at the right edge
+        self._dirty = False  # new samples since the last repaint
+        self._full_scale = None  # sensitivity full scale driving the X/Y/R ranges
+
+        # one persistent curve per stream; updates only call setData.  Only
+        # valid samples are ever passed in, so the finite check can be skipped.
+        curve_opts = dict(
+            pen=pg.mkPen((255, 255, 255), width=3),
+            antialias=False,
+            autoDownsample=True,
+            downsampleMethod="peak",  # keeps spikes visible when decimated
+            clipToView=True,
+            skipFiniteCheck=True,
+        )
+        self.curve_x = self.plot_xy.plot(name="X", **curve_opts)
+        self.curve_y = self.plot_xy.plot(name="Y", **dict(curve_opts, pen=pg.mkPen((255, 200, 0), width=3)))
+        self.curve_r = self.plot_r.plot(**curve_opts)
+        self.curve_t = self.plot_t.plot(**curve_opts)
 
         #----self defined get and set methods-----
         self.get_methods = [
@@ -65,66 +174,64 @@ class SR860(QtWidgets.QWidget):
             if callable(getattr(self.logic, method)) and method.startswith("set_")
         ]
 
-        # ----- connect logic signals to update-slots -----
-        self.logic.sig_frequency.connect(self.update_frequency)
-        self.logic.sig_amplitude.connect(self.update_amplitude)
-        self.logic.sig_time_constant.connect(self.update_time_constant)
-        self.logic.sig_sensitivity.connect(self.update_sensitivity)
-        self.logic.sig_phase.connect(self.update_phase)
-        self.logic.sig_ref_mode.connect(self.update_ref_mode)
-        self.logic.sig_ext_trigger.connect(self.update_ext_trigger)
-        # self.logic.sig_ref_input.connect(self.update_ref_input)
-        self.logic.sig_sync_filter.connect(self.update_sync_filter)
-        self.logic.sig_harmonic.connect(self.update_harmonic)
-        # self.logic.sig_signal_input_type.connect(self.update_signal_input_type)
-        # self.logic.sig_signal_input_mode.connect(self.update_signal_input_mode)
-        # self.logic.sig_signal_input_type.connect(self.update_signal_input_config)
-        # self.logic.sig_signal_input_mode.connect(self.update_signal_input_config)
-        self.logic.sig_input_config.connect(self.update_signal_input_config)
-        self.logic.sig_input_config.connect(self.update_input_config)
-        self.logic.sig_voltage_input_coupling.connect(self.update_voltage_input_coupling)
-        self.logic.sig_voltage_input_range.connect(self.update_voltage_input_range)
-        self.logic.sig_current_input_range.connect(self.update_current_input_range)
-        self.logic.sig_unlocked.connect(self.update_unlocked)
-        self.logic.sig_input_overload.connect(self.update_input_overload)
-        self.logic.sig_sensitivity_overload.connect(self.update_sensitivity_overload)
-        self.logic.sig_X.connect(self.update_X)
-        self.logic.sig_Y.connect(self.update_Y)
-        self.logic.sig_R.connect(self.update_R)
-        self.logic.sig_Theta.connect(self.update_Theta)
-        self.logic.sig_is_changing.connect(self.update_status)
-        self.logic.sig_connected.connect(self.update_status)
-        self.logic.sig_input_shield.connect(self.update_input_shield)
-        self.logic.sig_dc_level.connect(self.update_dc_level)
-        self.logic.sig_dc_level_mode.connect(self.update_dc_level_mode)
-        self.logic.sig_filter_slope.connect(self.update_filter_slope)
-
-        # ----- connect UI widgets to get/set actions -----
-        self.freq_doubleSpinBox.valueChanged.connect(self.set_frequency)
-        self.ampl_doubleSpinBox.valueChanged.connect(self.set_amplitude)
-        self.time_constant_comboBox.currentIndexChanged.connect(self.set_time_constant)
-        self.sensitivity_comboBox.currentIndexChanged.connect(self.set_sensitivity)
+        # ----- table-driven get_/set_/update_ wrappers -----
+        # logic signals are emitted on the I/O thread: connect them queued
+        # explicitly; widget -> setter connections stay on the GUI thread
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        # widget edits are coalesced: spinbox drags only send the latest value
+        # per setting once the widget has been quiet for 80 ms
+        self._pending = {}  # name -> latest widget value, see _defer
+        self._writing = {}  # name -> set_<name> jobs submitted but not done yet
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(80)
+        self._debounce.timeout.connect(self._flush_pending)
+        for name, widget_name, kind, _signal in self.SPEC:
+            widget = getattr(self, widget_name)
+            setter = self._make_setter(name, widget, kind)
+            setattr(self, f"set_{name}", setter)
+            getattr(widget, _WIDGET_KINDS[kind][3]).connect(partial(self._defer, name))
+        self._display = {}  # name -> (widget, show), see _apply
+        self._shown = {}  # name -> value last pushed to its widget by _apply
+        for name, widget_name, kind, signal in self.SPEC + self.READBACK_SPEC:
+            setattr(self, f"get_{name}", self._make_getter(name))
+            if signal is not None:
+                self._display[name] = (getattr(self, widget_name), _WIDGET_KINDS[kind][1])
+                updater = partial(self._apply, name)
+                setattr(self, f"update_{name}", updater)
+                getattr(self.logic, signal).connect(updater, type=queued)
+        self._display["input_config"] = (self.input_config_comboBox, _WIDGET_KINDS["combo"][1])
+
+        # ----- connect remaining logic signals to update-slots -----
+        self.logic.sig_input_config.connect(self.update_signal_input_config, type=queued)
+        self.logic.sig_sensitivity.connect(self._range_from_sensitivity, type=queued)
+        # the monitor delivers X/Y/R/Theta together in one emission
+        self.logic.sig_XYRT.connect(self.update_XYRT, type=queued)
+        self.logic.sig_all_state.connect(self.update_all_state, type=queued)
+        self.logic.sig_is_changing.connect(self.update_status, type=queued)
+        self.logic.sig_connected.connect(self.update_status, type=queued)
+        self.logic.sig_job_done.connect(self.job_done, type=queued)
+
+        # ----- connect remaining UI widgets to set actions -----
+        self.sensitivity_comboBox.currentIndexChanged.connect(self.start_timer)
         self.auto_scale_pushButton.clicked.connect(self.set_auto_scale)
-        self.phase_doubleSpinBox.valueChanged.connect(self.set_phase)
         self.auto_phase_pushButton.clicked.connect(self.set_auto_phase)
-        self.ref_mode_comboBox.currentIndexChanged.connect(self.set_ref_mode)
-        self.trig_comboBox.currentIndexChanged.connect(self.set_ext_trigger)
-        self.ext_ref_comboBox.currentIndexChanged.connect(self.set_ref_input)
-        self.sync_filter_checkBox.stateChanged.connect(self.set_sync_filter)
-        self.harmonic_spinBox.valueChanged.connect(self.set_harmonic)
-        self.input_shield_comboBox.currentIndexChanged.connect(self.set_input_shield)
-        self.dclevel_doubleSpinBox.valueChanged.connect(self.set_dc_level)
-        self.dclevel_mode_comboBox.currentIndexChanged.connect(self.set_dc_level_mode)
-        self.filter_slope_comboBox.currentIndexChanged.connect(self.set_filter_slope)
-
-        # voltage / signal input helpers
-        self.input_config_comboBox.currentIndexChanged.connect(self.set_signal_input_config)
-        self.voltage_range_comboBox.currentIndexChanged.connect(self.set_signal_input_config)
-        self.current_range_comboBox.currentIndexChanged.connect(self.set_signal_input_config)
-        self.auto_range_pushButton.clicked.connect(self.set_auto_range)
 
-        self.input_coupling_comboBox.currentIndexChanged.connect(self.set_voltage_input_coupling)
-        # self.input_range_comboBox.currentIndexChanged.connect(self.set_voltage_input_range)
+        # voltage / signal input helpers; item texts are fixed in the .ui, so
+        # read them once and index into the lists on every change
+        self._input_configs = self._combo_texts(self.input_config_comboBox)
+        self._voltage_ranges = self._combo_texts(self.voltage_range_comboBox)
+        self._current_ranges = self._combo_texts(self.current_range_comboBox)
+        # the three combos form one instrument command; a 0 ms single-shot timer
+        # coalesces changes made in the same event-loop pass into one write
+        self._cfg_timer = QtCore.QTimer(self)
+        self._cfg_timer.setSingleShot(True)
+        self._cfg_timer.setInterval(0)
+        self._cfg_timer.timeout.connect(self._flush_signal_input_config)
+        self.input_config_comboBox.currentIndexChanged.connect(self._queue_signal_input_config)
+        self.voltage_range_comboBox.currentIndexChanged.connect(self._queue_signal_input_config)
+        self.current_range_comboBox.currentIndexChanged.connect(self._queue_signal_input_config)
+        self.auto_range_pushButton.clicked.connect(self.set_auto_range)
 
         self.connect_pushButton.clicked.connect(self.connect_visa)
         self.pause_graph_button.clicked.connect(self.stop_timer)
@@ -132,32 +239,93 @@ class SR860(QtWidgets.QWidget):
         self.disconnect_pushButton.clicked.connect(self.disconnect_device)
 
         # ----- periodic monitor -----
+        # single-shot: re-armed once the previous get_all has finished, so a
+        # slow bus stretches the poll interval instead of piling up requests
+        self._monitoring = True
+        self._get_all_pending = False
+        self._resume_on_show = False  # monitor was stopped by hideEvent, not by the user
         self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self.timer.setSingleShot(True)
+        # instrument poll rate (~10 Hz) is independent of the 30 Hz repaint below
+        self.timer.setInterval(100)  # lower bound between two polls
         self.timer.timeout.connect(self.monitor)
-        self.timer.start(50)
+        self.timer.start()
         self.stop_signal.connect(self.stop_timer)
 
+        # ----- live plot repaint, decoupled from the sample rate (~30 Hz) -----
+        self.repaint_timer = QtCore.QTimer(self)
+        self.repaint_timer.timeout.connect(self.flush_graph)
+        self.repaint_timer.start(33)
+
+        # ----- coarse y-range refresh for the live plots -----
+        self.rescale_timer = QtCore.QTimer(self)
+        self.rescale_timer.setTimerType(QtCore.Qt.TimerType.CoarseTimer)
+        self.rescale_timer.timeout.connect(self.rescale_graph)
+        self.rescale_timer.start(1000)
+
     # ------------------------------------------------------------------
     # UI helpers
     # ------------------------------------------------------------------
     def reset_graph(self):
-        self.x_log[:] = np.nan
-        self.y_log[:] = np.nan
-        self.r_log[:] = np.nan
-        self.t_log[:] = np.nan
-        pen = pg.mkPen((255, 255, 255), width=3)
-        self.plot_x.plot(self.x_log, clear=True, pen=pen)
-        self.plot_y.plot(self.y_log, clear=True, pen=pen)
-        self.plot_r.plot(self.r_log, clear=True, pen=pen)
-        self.plot_t.plot(self.t_log, clear=True, pen=pen)
+        self._heads = [0, 0, 0, 0]
+        self._dirty = False
+        # a (re)connected instrument reports its sensitivity afresh; until then
+        # *rescale_timer* fits the X/Y/R ranges to the new data again
+        self._full_scale = None
+        for curve, buf in zip((self.curve_x, self.curve_y, self.curve_r, self.curve_t), self._logs):
+            curve.setData(self._xs[:0], buf[:0])
+
+    def rescale_graph(self):
+        """Fit the X/Y/R y-ranges to the buffered data until the sensitivity is known."""
+        if self._full_scale is not None:
+            return
+        for plot, rows in ((self.plot_xy, (0, 1)), (self.plot_r, (2,))):
+            data = np.concatenate([self._window_of(row) for row in rows])
+            if data.size == 0 or np.isnan(data).all():
+                continue
+            plot.setYRange(np.nanmin(data), np.nanmax(data), padding=0.05)
+
+    def _range_from_sensitivity(self, label):
+        """Fix the X/Y/R y-ranges to the full scale of sensitivity *label*."""
+        try:
+            number, volt_unit, current_unit = str(label).replace("[", "").replace("]", "").split()
+            current = self.input_config_comboBox.currentText() == "Current"
+            full_scale = float(number) * _SCALE_UNITS[current_unit if current else volt_unit]
+        except (ValueError, KeyError):
+            return
+        if full_scale == self._full_scale:
+            return
+        self._full_scale = full_scale
+        self.plot_xy.setYRange(-full_scale, full_scale, padding=0.05)
+        self.plot_r.setYRange(0, full_scale, padding=0.05)
 
     def stop_timer(self):
+        self._monitoring = False
         if self.timer.isActive():
             self.timer.stop()
 
     def start_timer(self):
-        if not self.timer.isActive():
-            self.timer.start(50)
+        self._monitoring = True
+        if not self.timer.isActive() and not self._get_all_pending:
+            self.timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._resume_on_show:
+            self._resume_on_show = False
+            self.start_timer()
+
+    def hideEvent(self, event):
+        # only a visible SR860 polls the bus; a user pause survives hide/show
+        if self._monitoring:
+            self._resume_on_show = True
+            self.stop_timer()
+        super().hideEvent(event)
+
+    @staticmethod
+    def _combo_texts(combo):
+        return [combo.itemText(i) for i in range(combo.count())]
 
     def update_status(self, txt):
         """Generic label updater for *sig_is_changing* & *sig_connected*."""
@@ -166,192 +334,100 @@ class SR860(QtWidgets.QWidget):
     # ------------------------------------------------------------------
     # VISA connection
     # ------------------------------------------------------------------
+    def _list_addresses(self):
+        """Pool-thread task: probe the VISA bus and hand the result to the GUI thread."""
+        try:
+            resources = list(get_rm().list_resources())
+            if sip.isdeleted(self):
+                return  # widget destroyed while the bus was being probed
+            QtCore.QMetaObject.invokeMethod(
+                self,
+                "_populate_addresses",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(list, resources),
+            )
+        except Exception as exc:  # incl. RuntimeError if deleted after the check
+            log.warning("Listing VISA resources failed: %s", exc)
+
+    @QtCore.pyqtSlot(list)
+    def _populate_addresses(self, resources):
+        known = set(self._combo_texts(self.address_cb))
+        self.address_cb.addItems([a for a in resources if a not in known])
+
     def connect_visa(self, addr):
-        if addr == None or addr == False:
+        if not addr:  # None, False from clicked(bool) or an empty string
             addr = self.address_cb.currentText()
-        print(f"Connecting to {addr}")
+        log.info("Connecting to %s", addr)
+        self.reset_graph()
         self.logic.connect_visa(addr)
+        # the resource list may not be populated yet when connecting from a script
+        if self.address_cb.findText(addr) < 0:
+            self.address_cb.addItem(addr)
         self.address_cb.setCurrentText(addr)
 
     # ------------------------------------------------------------------
-    # get_/set_ wrappers (naming follows sr860_logic)
+    # get_/set_/update_ wrappers (naming follows sr860_logic)
     # ------------------------------------------------------------------
-    def set_frequency(self, val: float | None = None):
-        self.logic.stop()
-        self.logic.setpoint_frequency = val if val is not None else self.freq_doubleSpinBox.value()
-        self.logic.job = "set_frequency"
-        self.logic.start()
-
-    def get_frequency(self):
-        self.logic.job = "get_frequency"
-        self.logic.start()
-
-    def update_frequency(self, val):
-        self.freq_doubleSpinBox.blockSignals(True)
-        self.freq_doubleSpinBox.setValue(float(val))
-        self.freq_doubleSpinBox.blockSignals(False)
-
-    # -- amplitude -----------------------------------------------------
-    def set_amplitude(self, val: float | None = None):
-        self.logic.stop()
-        self.logic.setpoint_amplitude = val if val is not None else self.ampl_doubleSpinBox.value()
-        self.logic.job = "set_amplitude"
-        self.logic.start()
-
-    def get_amplitude(self):
-        self.logic.job = "get_amplitude"
-        self.logic.start()
-
-    def update_amplitude(self, val):
-        self.ampl_doubleSpinBox.blockSignals(True)
-        self.ampl_doubleSpinBox.setValue(float(val))
-        self.ampl_doubleSpinBox.blockSignals(False)
-
-    # -- time-constant -------------------------------------------------
-    def set_time_constant(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_time_constant = idx if idx is not None else self.time_constant_comboBox.currentIndex()
-        self.logic.job = "set_time_constant"
-        self.logic.start()
-
-    def get_time_constant(self):
-        self.logic.job = "get_time_constant"
-        self.logic.start()
-
-    def update_time_constant(self, text):
-        self.time_constant_comboBox.blockSignals(True)
-        self.time_constant_comboBox.setCurrentText(str(text))
-        self.time_constant_comboBox.blockSignals(False)
-
-    # -- sensitivity ---------------------------------------------------
-    def set_sensitivity(self, idx: int | None = None):
-        self.logic.stop()
-        print("isRunning", self.logic.isRunning())
-        self.logic.setpoint_sensitivity = idx if idx is not None else self.sensitivity_comboBox.currentIndex()
-        print("setpoint_sensitivity", self.logic.setpoint_sensitivity)
-        self.logic.job = "set_sensitivity"
-        self.logic.start()
-        self.start_timer()
-
-    def get_sensitivity(self):
-        self.logic.job = "get_sensitivity"
-        self.logic.start()
-
-    def update_sensitivity(self, idx):
-        self.sensitivity_comboBox.blockSignals(True)
-        self.sensitivity_comboBox.setCurrentText(str(idx))
-        self.sensitivity_comboBox.blockSignals(False)
+    def _submit(self, job, **setpoints):
+        """Single dispatch site for all UI-triggered logic jobs."""
+        if not self.logic.connected:
+            return  # the worker would drop it anyway; don't wake it up
+        self.logic.submit(job, **setpoints)
+
+    def _make_setter(self, name, widget, kind):
+        """Return set_<name>: push the widget value to the logic set-point."""
+        read, _show, cast, _changed = _WIDGET_KINDS[kind]
+
+        def setter(val=None):
+            value = cast(read(widget) if val is None else val)
+            self._submit(f"set_{name}", **{f"setpoint_{name}": value})
+
+        return setter
+
+    def _defer(self, name, val):
+        """Remember the latest *val* of setting *name* and (re)arm the debounce timer."""
+        self._pending[name] = val
+        self._shown.pop(name, None)  # the widget no longer shows the read-back
+        self._debounce.start()
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        for name, val in pending.items():
+            getattr(self, f"set_{name}")(val)
+            if self.logic.connected:  # submitted; job_done releases it
+                self._writing[name] = self._writing.get(name, 0) + 1
+
+    def _make_getter(self, name):
+        """Return get_<name>: queue a read-back of *name* on the logic thread."""
+
+        def getter():
+            self._submit(f"get_{name}")
+
+        return getter
+
+    def _apply(self, name, val):
+        """update_<name>: show a value without re-triggering set_<name>."""
+        if name in self._pending:
+            return  # the user is editing it; the flush will write the new value
+        if name in self._shown and self._shown[name] == val:
+            return  # get_all repeats stable values; skip the re-layout
+        self._shown[name] = val
+        widget, show = self._display[name]
+        blocker = QtCore.QSignalBlocker(widget)
+        try:
+            show(widget, val)
+        finally:
+            del blocker
 
     def set_auto_scale(self):
-        self.logic.stop()
-        self.logic.job = "set_auto_scale"
-        self.logic.start()
-
-    # -- phase ---------------------------------------------------------
-    def set_phase(self, val: float | None = None):
-        self.logic.stop()
-        self.logic.setpoint_phase = val if val is not None else self.phase_doubleSpinBox.value()
-        self.logic.job = "set_phase"
-        self.logic.start()
-
-    def get_phase(self):
-        self.logic.job = "get_phase"
-        self.logic.start()
-    
+        self._submit("set_auto_scale")
+
     def set_auto_phase(self):
-        self.logic.stop()
-        self.logic.job = "set_auto_phase"
-        self.logic.start()
-
-    def update_phase(self, val):
-        self.phase_doubleSpinBox.blockSignals(True)
-        self.phase_doubleSpinBox.setValue(float(val))
-        self.phase_doubleSpinBox.blockSignals(False)
-
-    # -- reference mode -----------------------------------------------
-    def set_ref_mode(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_ref_mode = self.ref_mode_comboBox.currentText() if idx is None else idx
-        self.logic.job = "set_ref_mode"
-        self.logic.start()
-
-    def get_ref_mode(self):
-        self.logic.job = "get_ref_mode"
-        self.logic.start()
-
-    def update_ref_mode(self, idx):
-        self.ref_mode_comboBox.blockSignals(True)
-        self.ref_mode_comboBox.setCurrentText(idx)
-        self.ref_mode_comboBox.blockSignals(False)
-
-    # -- external trigger ---------------------------------------------
-    def set_ext_trigger(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_ext_trigger = self.trig_comboBox.currentText() if idx is None else idx
-        self.logic.job = "set_ext_trigger"
-        self.logic.start()
-
-    def get_ext_trigger(self):
-        self.logic.job = "get_ext_trigger"
-        self.logic.start()
-
-    def update_ext_trigger(self, idx):
-        self.trig_comboBox.blockSignals(True)
-        self.trig_comboBox.setCurrentText(idx)
-        self.trig_comboBox.blockSignals(False)
-
-    # -- reference input (boolean) ------------------------------------
-    def set_ref_input(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_ref_input = idx if idx is not None else self.ext_ref_comboBox.currentIndex()
-        self.logic.job = "set_ref_input"
-        self.logic.start()
-
-    def get_ref_input(self):
-        self.logic.job = "get_ref_input"
-        self.logic.start()
-
-    def update_ref_input(self, val):
-        self.ref_input_checkBox.blockSignals(True)
-        self.ref_input_checkBox.setChecked(bool(val))
-        self.ref_input_checkBox.blockSignals(False)
-
-    # -- sync filter (boolean) ----------------------------------------
-    def set_sync_filter(self, state: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_sync_filter = bool(state) if state is not None else self.sync_filter_checkBox.isChecked()
-        self.logic.job = "set_sync_filter"
-        self.logic.start()
-
-    def get_sync_filter(self):
-        self.logic.job = "get_sync_filter"
-        self.logic.start()
-
-    def update_sync_filter(self, val):
-        self.sync_filter_checkBox.blockSignals(True)
-        self.sync_filter_checkBox.setChecked(bool(val))
-        self.sync_filter_checkBox.blockSignals(False)
-
-    # -- harmonic ------------------------------------------------------
-    def set_harmonic(self, h: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_harmonic = h if h is not None else self.harmonic_spinBox.value()
-        self.logic.job = "set_harmonic"
-        self.logic.start()
-
-    def get_harmonic(self):
-        self.logic.job = "get_harmonic"
-        self.logic.start()
-
-    def update_harmonic(self, h):
-        self.harmonic_spinBox.blockSignals(True)
-        self.harmonic_spinBox.setValue(int(h))
-        self.harmonic_spinBox.blockSignals(False)
+        self._submit("set_auto_phase")
 
     # -- signal-input type / mode -------------------------------------
     def get_signal_input_type(self):
-        self.logic.job = "get_signal_input_type"
-        self.logic.start()
+        self._submit("get_signal_input_type")
 
     def update_signal_input_type(self, idx):
         self.input_type_comboBox.blockSignals(True)
@@ -359,131 +435,106 @@ class SR860(QtWidgets.QWidget):
         self.input_type_comboBox.blockSignals(False)
 
     def set_signal_input_config(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_input_config        = self.input_config_comboBox.currentText()
-        self.logic.setpoint_voltage_input_range = self.voltage_range_comboBox.currentText()
-        self.logic.setpoint_current_input_range = self.current_range_comboBox.currentText()
-        self.logic.job = "set_signal_input_config"
-        self.logic.start()
+        self._submit(
+            "set_signal_input_config",
+            setpoint_input_config=self._input_configs[self.input_config_comboBox.currentIndex()],
+            setpoint_voltage_input_range=self._voltage_ranges[self.voltage_range_comboBox.currentIndex()],
+            setpoint_current_input_range=self._current_ranges[self.current_range_comboBox.currentIndex()],
+        )
+
+    def _queue_signal_input_config(self, idx=None):
+        for name in ("input_config", "voltage_input_range", "current_input_range"):
+            self._shown.pop(name, None)
+        self._cfg_timer.start()
+
+    def _flush_signal_input_config(self):
+        self.set_signal_input_config()
 
     def update_signal_input_config(self, idx):
-        self.input_config_comboBox.blockSignals(True)
-        self.input_config_comboBox.setCurrentText(idx)
-        self.input_config_comboBox.blockSignals(False)
+        self._apply("input_config", idx)
 
     def set_auto_range(self):
-        self.logic.stop()
-        self.logic.job = "set_auto_range"
-        self.logic.start()
+        self._submit("set_auto_range")
 
     def get_signal_input_mode(self):
-        self.logic.job = "get_signal_input_mode"
-        self.logic.start()
+        self._submit("get_signal_input_mode")
 
     def update_signal_input_mode(self, idx):
         self.input_mode_comboBox.blockSignals(True)
         self.input_mode_comboBox.setCurrentText(idx)
         self.input_mode_comboBox.blockSignals(False)
 
-    # -- voltage input coupling / range --------------------------------
-    def set_voltage_input_coupling(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_voltage_input_coupling = self.input_coupling_comboBox.currentIndex() if idx is None else idx
-        self.logic.job = "set_voltage_input_coupling"
-        self.logic.start()
-
-    def get_voltage_input_coupling(self):
-        self.logic.job = "get_voltage_input_coupling"
-        self.logic.start()
-
-    def update_voltage_input_coupling(self, idx):
-        self.input_coupling_comboBox.blockSignals(True)
-        self.input_coupling_comboBox.setCurrentText(str(idx))
-        self.input_coupling_comboBox.blockSignals(False)
-
-    # def set_voltage_input_range(self, idx: int | None = None):
-    #     self.logic.stop()
-    #     self.logic.setpoint_voltage_input_range = idx if idx is not None else self.input_range_comboBox.currentIndex()
-    #     self.logic.job = "set_voltage_input_range"
-    #     self.logic.start()
-
-    def get_voltage_input_range(self):
-        self.logic.job = "get_voltage_input_range"
-        self.logic.start()
-
-    def update_voltage_input_range(self, idx):
-        self.voltage_range_comboBox.blockSignals(True)
-        self.voltage_range_comboBox.setCurrentText(idx)
-        self.voltage_range_comboBox.blockSignals(False)
-
-    def update_current_input_range(self, idx):
-        self.current_range_comboBox.blockSignals(True)
-        self.current_range_comboBox.setCurrentText(idx)
-        self.current_range_comboBox.blockSignals(False)
-
-    # -- unlocked & overload flags ------------------------------------
-    def get_unlocked(self):
-        self.logic.job = "get_unlocked"
-        self.logic.start()
-
-    def update_unlocked(self, val):
-        self.unlocked_radioButton.blockSignals(True)
-        self.unlocked_radioButton.setChecked(bool(val))
-        self.unlocked_radioButton.blockSignals(False)
-
-    def get_input_overload(self):
-        self.logic.job = "get_input_overload"
-        self.logic.start()
-
-    def update_input_overload(self, val):
-        self.input_ovld_radioButton.blockSignals(True)
-        self.input_ovld_radioButton.setChecked(bool(val))
-        self.input_ovld_radioButton.blockSignals(False)
-
-    def get_sensitivity_overload(self):
-        self.logic.job = "get_sensitivity_overload"
-        self.logic.start()
-    
-    def update_sensitivity_overload(self, val):
-        self.sens_ovld_radioButton.blockSignals(True)
-        self.sens_ovld_radioButton.setChecked(bool(val))
-        self.sens_ovld_radioButton.blockSignals(False)
+    def update_all_state(self, state):
+        """Apply a get_all batch; names without a widget (e.g. ref_input) are skipped.
+
+        A batch read before a pending set_<name> reached the instrument holds
+        the old value, so names still being written keep what the user entered.
+        """
+        for name, val in state.items():
+            if name in self._display and name not in self._writing:
+                self._apply(name, val)
+        if "sensitivity" in state:
+            self._range_from_sensitivity(state["sensitivity"])
 
     # -- outputs streaming --------------------------------------------
-    def update_X(self, val):
-        self.x_log[:-1] = self.x_log[1:]
-        self.x_log[-1] = val
-        pen = pg.mkPen((255, 255, 255), width=3)
-        self.plot_x.plot(self.x_log, clear=True, pen=pen)
-
-    def update_Y(self, val):
-        self.y_log[:-1] = self.y_log[1:]
-        self.y_log[-1] = val
-        pen = pg.mkPen((255, 255, 255), width=3)
-        self.plot_y.plot(self.y_log, clear=True, pen=pen)
-
-    def update_R(self, val):
-        self.r_log[:-1] = self.r_log[1:]
-        self.r_log[-1] = val
-        pen = pg.mkPen((255, 255, 255), width=3)
-        self.plot_r.plot(self.r_log, clear=True, pen=pen)
-
-    def update_Theta(self, val):
-        self.t_log[:-1] = self.t_log[1:]
-        self.t_log[-1] = val
-        pen = pg.mkPen((255, 255, 255), width=3)
-        self.plot_t.plot(self.t_log, clear=True, pen=pen)
+    def _push(self, row, val):
+        """Append *val* to buffer *row*; the curve is redrawn by *repaint_timer*."""
+        buf = self._logs[row]
+        head = self._heads[row]
+        if head == buf.size:
+            # full: keep the newest window at the front (once every 200 samples)
+            buf[:self._window] = buf[self._window:]
+            head = self._window
+        buf[head] = val
+        self._heads[row] = head + 1
+        self._dirty = True
+
+    def _window_of(self, row):
+        """Oldest-to-newest view of the last (up to) 200 samples of *row*."""
+        head = self._heads[row]
+        return self._logs[row, max(0, head - self._window):head]
+
+    def flush_graph(self):
+        """Push the buffered samples to the curves, at most once per repaint tick."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        curves = (self.curve_x, self.curve_y, self.curve_r, self.curve_t)
+        for row, curve in enumerate(curves):
+            data = self._window_of(row)
+            curve.setData(self._xs[self._window - data.size:], data)
+
+    def update_XYRT(self, x, y, r, theta):
+        self._push(0, x)
+        self._push(1, y)
+        self._push(2, r)
+        self._push(3, theta)
 
     # ------------------------------------------------------------------
     # periodic monitor
     # ------------------------------------------------------------------
     def monitor(self):
         if not self.logic.connected:
+            # nothing in flight any more; keep ticking until a connection exists
+            self._get_all_pending = False
+            self.timer.start()
             return
-        if self.logic.isRunning():
+        if self._get_all_pending:
+            return  # job_done re-arms the timer
+        self._get_all_pending = True
+        self._submit("get_all")  # bulk helper from sr860_logic
+
+    def job_done(self, job):
+        name = job[len("set_"):] if job.startswith("set_") else None
+        if name in self._writing:
+            self._writing[name] -= 1
+            if not self._writing[name]:
+                del self._writing[name]
+        if job != "get_all":
             return
-        self.logic.job = "get_all"  # bulk helper from sr860_logic
-        self.logic.start()
+        self._get_all_pending = False
+        if self._monitoring:
+            self.start_timer()
 
     # ------------------------------------------------------------------
     # stubs for functionality not implemented in sr860_logic
@@ -497,25 +548,8 @@ class SR860(QtWidgets.QWidget):
     def update_input_config(self, *_):
         pass
 
-    def set_input_shield(self, *_):
-        self.logic.stop()
-        self.logic.setpoint_input_shield = self.input_shield_comboBox.currentText()
-        self.logic.job = "set_input_shield"
-        self.logic.start()
-
-    def get_input_shield(self):
-        self.logic.job = "get_input_shield"
-        self.logic.start()
-
-    def update_input_shield(self, val):
-        self.input_shield_comboBox.blockSignals(True)
-        self.input_shield_comboBox.setCurrentText(val)
-        self.input_shield_comboBox.blockSignals(False)  
-
     def set_notch_filter(self, *_):
-        self.logic.stop()
-        self.logic.job = "set_notch_filter"
-        self.logic.start()
+        self._submit("set_notch_filter")
 
     def get_notch_filter(self):
         pass
@@ -523,54 +557,6 @@ class SR860(QtWidgets.QWidget):
     def update_notch_filter(self, *_):
         pass
 
-    # -- dc level -----------------------------------------------------
-    def set_dc_level(self, val: float | None = None):
-        self.logic.stop()
-        self.logic.setpoint_dc_level = val if val is not None else self.dclevel_doubleSpinBox.value()
-        self.logic.job = "set_dc_level"
-        self.logic.start()
-    
-    def get_dc_level(self):
-        self.logic.job = "get_dc_level"
-        self.logic.start()
-    
-    def update_dc_level(self, val):
-        self.dclevel_doubleSpinBox.blockSignals(True)
-        self.dclevel_doubleSpinBox.setValue(float(val))
-        self.dclevel_doubleSpinBox.blockSignals(False)
-
-    def set_dc_level_mode(self, idx: int | None = None):
-        self.logic.stop()
-        print(self.dclevel_mode_comboBox.currentIndex())
-        self.logic.setpoint_dc_level_mode = self.dclevel_mode_comboBox.currentText() if idx is None else idx
-        self.logic.job = "set_dc_level_mode"
-        self.logic.start()
-
-    def get_dc_level_mode(self):
-        self.logic.job = "get_dc_level_mode"
-        self.logic.start()
-
-    def update_dc_level_mode(self, idx):
-        self.dclevel_mode_comboBox.blockSignals(True)
-        self.dclevel_mode_comboBox.setCurrentText(str(idx))
-        self.dclevel_mode_comboBox.blockSignals(False)
-
-    # -- filter slope -------------------------------------------------
-    def set_filter_slope(self, idx: int | None = None):
-        self.logic.stop()
-        self.logic.setpoint_filter_slope = self.filter_slope_comboBox.currentText() if idx is None else idx
-        self.logic.job = "set_filter_slope"
-        self.logic.start()
-    
-    def get_filter_slope(self):
-        self.logic.job = "get_filter_slope"
-        self.logic.start()
-    
-    def update_filter_slope(self, idx):
-        self.filter_slope_comboBox.blockSignals(True)
-        self.filter_slope_comboBox.setCurrentText(str(idx))
-        self.filter_slope_comboBox.blockSignals(False)
-
     # -- reserve ----------------------------------------------------- 
     def set_reserve(self, *_):
         pass
@@ -618,8 +604,16 @@ class SR860(QtWidgets.QWidget):
         self.logic.disconnect()
 
     def terminate_dev(self):
+        """Close the VISA link and stop the I/O thread; safe to call more than once."""
         self.logic.disconnect()
-        
+        if self._io_thread.isRunning():
+            self._io_thread.quit()
+            self._io_thread.wait()
+
+    def closeEvent(self, event):
+        self.terminate_dev()
+        super().closeEvent(event)
+
 
 # ----------------------------------------------------------------------
 # Stand-alone entry-point
@@ -0,0 +1,136 @@
+import sys
+import unittest
+
+import numpy as np
+
+from core.brakets import Brakets, _plan
+
+
+def _reference_output(cmd, destinations):
+    """Output of the original recursive Brakets walk, used as the oracle."""
+    dests = {k.upper(): np.asarray(v).ravel() for k, v in destinations.items()}
+    channels = list(dests.keys())
+
+    lengths = {}  # memo only, so deep oracle runs stay fast
+
+    def length(node, parallel):
+        key = (id(node), parallel)
+        if key not in lengths:
+            lengths[key] = _length(node, parallel)
+        return lengths[key]
+
+    def _length(node, parallel):
+        if isinstance(node, list):
+            if parallel:
+                return max((length(sub, False) for sub in node), default=0)
+            return sum(length(sub, isinstance(sub, list)) for sub in node)
+        return dests.get(node, np.asarray([])).size
+
+    def unpack(node, start_col, parallel):
+        if isinstance(node, list):
+            if parallel:
+                for sub in node:
+                    unpack(sub, start_col, False)
+            else:
+                col = start_col
+                for sub in node:
+                    unpack(sub, col, isinstance(sub, list))
+                    col += length(sub, isinstance(sub, list))
+        else:
+            vals = dests.get(node)
+            if vals is None or vals.size == 0:
+                return
+            output[channels.index(node), start_col:start_col + vals.size] = vals
+
+    cmd = Brakets._upperise(cmd)
+    output = np.full((len(channels), length(cmd, False)), np.nan)
+    unpack(cmd, 0, False)
+    return output
+
+
+DESTINATIONS = {
+    "a": [1, 2],
+    "B": np.array([3]),
+    "c": [4, 5, 6],
+    "D": np.array([7, 8]),
+    "e": [9],
+    "F": [],
+}
+
+
+class BraketsTest(unittest.TestCase):
+    def assert_matches_reference(self, cmd, destinations=DESTINATIONS):
+        expected = _reference_output(cmd, destinations)
+        actual = Brakets(cmd=cmd, destinations=destinations).output
+        self.assertEqual(actual.dtype, np.float64)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_flat_and_plus_groups(self):
+        self.assert_matches_reference(["a", ["B", "c"], "d", ["e", "f"]])
+
+    def test_nested_groups(self):
+        self.assert_matches_reference([["a", ["B", "c"]], "d"])
+        self.assert_matches_reference([["a", ["B", ["c", "D"], "e"]], ["c", "a"]])
+        self.assert_matches_reference(["a", [["B", "c"], ["D", ["e", "a"]]], "c"])
+
+    def test_deep_nesting(self):
+        cmd = "a"
+        for channel in ("B", "c", "D", "e") * 10:
+            cmd = [channel, [cmd, channel]]
+        self.assert_matches_reference(cmd)
+
+    def test_nesting_deeper_than_the_recursion_limit(self):
+        depth = 1500
+        cmd = "e"
+        for level in range(depth):
+            cmd = ["a" if level % 2 else "B", [cmd, "c"]]
+
+        # the Brakets build itself runs at the default recursion limit
+        actual = Brakets(cmd=cmd, destinations=DESTINATIONS).output
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 8 * depth))
+        try:
+            expected = _reference_output(cmd, DESTINATIONS)
+        finally:
+            sys.setrecursionlimit(limit)
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_unknown_and_empty_channels(self):
+        self.assert_matches_reference(["zz", ["F", "a"], "f", ["yy", "xx"]])
+        self.assert_matches_reference([])
+
+    def test_parsed_text_command(self):
+        parsed = Brakets._parse_plus_comma(" a + B , c ,, d+E+f ")
+        self.assertEqual(parsed, [["a", "B"], "c", ["d", "E", "f"]])
+        np.testing.assert_array_equal(
+            Brakets(cmd=" a + B , c ,, d+E+f ", destinations=DESTINATIONS).output,
+            _reference_output(parsed, DESTINATIONS),
+        )
+
+    def test_auto_command(self):
+        auto = Brakets(cmd="ignored", destinations=DESTINATIONS, personalized_input=False)
+        np.testing.assert_array_equal(
+            auto.output, _reference_output(list(auto.destinations), DESTINATIONS)
+        )
+
+    def test_cached_plan_is_reused_with_new_values(self):
+        cmd = [["a", ["B", "c"]], "d", ["c", "a"]]
+        first = {"a": [1, 2], "B": [3], "c": [4, 5], "D": [6]}
+        second = {"a": [10, 20], "B": [30], "c": [40, 50], "D": [60]}
+
+        Brakets(cmd=cmd, destinations=first)
+        hits = _plan.cache_info().hits
+        reused = Brakets(cmd=cmd, destinations=second)
+
+        self.assertEqual(_plan.cache_info().hits, hits + 1)
+        np.testing.assert_array_equal(reused.output, _reference_output(cmd, second))
+
+    def test_changed_lengths_get_a_new_plan(self):
+        cmd = [["a", "B"], "c"]
+        Brakets(cmd=cmd, destinations={"a": [1], "B": [2], "c": [3]})
+        self.assert_matches_reference(cmd, {"a": [1, 2, 3], "B": [4], "c": [5, 6]})
+
+
+if __name__ == "__main__":
+    unittest.main()
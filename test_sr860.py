@@ -0,0 +1,182 @@
+import os
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import QtCore, QtWidgets
+
+from sr860.sr860_logic import SR860_Logic
+from sr860.sr860_main import SR860
+
+
+class FakeSR860Hardware:
+    def __init__(self):
+        self.frequency = 1000.0
+        self.write_log = []
+        self.threads = []
+        self.disconnected = False
+
+    def get_frequency(self):
+        self.threads.append(QtCore.QThread.currentThread())
+        return self.frequency
+
+    def set_frequency(self, value):
+        self.threads.append(QtCore.QThread.currentThread())
+        self.frequency = value
+        self.write_log.append(("frequency", value))
+
+    def get_amplitude(self):
+        raise RuntimeError("get_amplitude failed")
+
+    def input_overload(self):
+        return False
+
+    def sensitivity_overload(self):
+        return True
+
+    def get_XYRT(self):
+        return 1.0, 2.0, 3.0, 4.0
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def wait_for(predicate, timeout=1.0):
+    app = QtCore.QCoreApplication.instance()
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        app.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.01)
+    app.processEvents()
+    return predicate()
+
+
+class SR860LogicTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        self.hardware = FakeSR860Hardware()
+        self.logic = SR860_Logic()
+        self.logic.hardware = self.hardware
+        self.logic.connected = True
+        self.thread = QtCore.QThread()
+        self.logic.moveToThread(self.thread)
+        self.thread.start()
+
+        self.done = []
+        self.frequencies = []
+        self.xyrt = []
+        self.states = []
+        self.logic.sig_job_done.connect(self.done.append, type=queued)
+        self.logic.sig_frequency.connect(self.frequencies.append, type=queued)
+        self.logic.sig_XYRT.connect(lambda *sample: self.xyrt.append(sample), type=queued)
+        self.logic.sig_all_state.connect(self.states.append, type=queued)
+
+    def tearDown(self):
+        self.logic.disconnect()
+        self.thread.quit()
+        self.thread.wait()
+
+    def test_job_table_resolves_wrappers_once(self):
+        table = self.logic._job_table
+        self.assertEqual(table["set_frequency"], self.logic.set_frequency)
+        self.assertIn("get_all", table)
+        self.assertNotIn("run_job", table)
+        self.assertNotIn("submit", table)
+
+    def test_jobs_run_on_the_io_thread_with_their_setpoints(self):
+        self.logic.submit("set_frequency", setpoint_frequency=2500.0)
+        self.logic.submit("get_frequency")
+
+        self.assertTrue(wait_for(lambda: len(self.done) == 2))
+        self.assertEqual(self.done, ["set_frequency", "get_frequency"])
+        self.assertEqual(self.hardware.write_log, [("frequency", 2500.0)])
+        self.assertEqual(self.frequencies, [2500.0, 2500.0])
+        self.assertIsInstance(self.frequencies[0], float)
+        self.assertEqual(self.hardware.threads, [self.thread, self.thread])
+        self.assertEqual(self.logic.job, "")
+
+    def test_get_all_emits_one_sample_and_one_state_batch(self):
+        self.logic.monitor_count = 0
+        self.logic.submit("get_all")
+
+        self.assertTrue(wait_for(lambda: self.done == ["get_all"]))
+        self.assertEqual(self.xyrt, [(1.0, 2.0, 3.0, 4.0)])
+        self.assertEqual(self.states, [{"input_overload": False, "sensitivity_overload": True}])
+
+    def test_failing_and_unknown_jobs_still_report_done(self):
+        self.logic.submit("get_amplitude")
+        self.logic.submit("get_nothing")
+
+        self.assertTrue(wait_for(lambda: len(self.done) == 2))
+        self.assertEqual(self.done, ["get_amplitude", "get_nothing"])
+
+    def test_jobs_after_disconnect_are_dropped(self):
+        self.logic.disconnect()
+        self.logic.submit("set_frequency", setpoint_frequency=5.0)
+
+        self.assertTrue(wait_for(lambda: self.done == ["set_frequency"]))
+        self.assertTrue(self.hardware.disconnected)
+        self.assertEqual(self.hardware.write_log, [])
+
+
+class SR860WidgetTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.window = SR860()
+        self.window.stop_timer()
+
+    def tearDown(self):
+        self.window.terminate_dev()
+        self.window.deleteLater()
+
+    def test_logic_lives_on_a_running_io_thread(self):
+        self.assertIs(self.window.logic.thread(), self.window._io_thread)
+        self.assertTrue(self.window._io_thread.isRunning())
+
+    def test_closing_the_window_stops_the_io_thread(self):
+        self.window.show()
+        self.window.close()
+
+        self.assertFalse(self.window._io_thread.isRunning())
+        self.window.terminate_dev()  # second call (e.g. aboutToQuit) is a no-op
+
+    def test_state_batches_do_not_overwrite_an_edit_in_progress(self):
+        window = self.window
+        spin = window.freq_doubleSpinBox
+        done = []
+        window.logic.sig_job_done.connect(done.append, type=QtCore.Qt.ConnectionType.QueuedConnection)
+        window.logic.connected = True  # no hardware: set jobs are dropped but still report done
+        window.update_all_state({"frequency": 1000.0})
+        self.assertEqual(spin.value(), 1000.0)
+
+        # edit inside the 80 ms debounce window, then a stale get_all batch
+        spin.setValue(2000.0)
+        self.assertEqual(window._pending, {"frequency": 2000.0})
+        window.update_all_state({"frequency": 1000.0})
+        self.assertEqual(spin.value(), 2000.0)
+
+        # flushed but not yet written: a batch read before the write is stale too
+        window._flush_pending()
+        window.update_all_state({"frequency": 1000.0})
+        self.assertEqual(spin.value(), 2000.0)
+
+        # once set_frequency is done, read-backs are shown again
+        self.assertTrue(wait_for(lambda: "set_frequency" in done))
+        self.assertEqual(window._writing, {})
+        window.update_all_state({"frequency": 1500.0})
+        self.assertEqual(spin.value(), 1500.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
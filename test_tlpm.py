@@ -0,0 +1,93 @@
+import math
+import unittest
+
+import numpy as np
+
+from tlpm.tlpm_logic import TLPMLogic
+from tlpm.tlpm_main import LIMITS, format_power
+
+
+class FakeFastArrayHardware:
+    def __init__(self, bursts):
+        self.bursts = list(bursts)
+        self.calls = []
+
+    def confPowerFastArrayMeasurement(self):
+        self.calls.append("conf")
+
+    def getNextFastArrayMeasurement(self, count, timestamps, values):
+        stamps, powers = self.bursts.pop(0)
+        count._obj.value = len(stamps)
+        for i, (stamp, power) in enumerate(zip(stamps, powers)):
+            timestamps[i] = stamp
+            values[i] = power
+
+    def resetFastArrayMeasurement(self):
+        raise NameError(b"reset rejected")
+
+
+class FormatPowerTests(unittest.TestCase):
+    def test_zero_reads_as_milliwatt(self):
+        self.assertEqual(format_power(0.0), "0.00 mW")
+
+    def test_non_finite_readings_are_shown_in_watt(self):
+        self.assertEqual(format_power(math.nan), "nan W")
+        self.assertEqual(format_power(math.inf), "inf W")
+
+    def test_exact_limits_stay_in_the_smaller_unit(self):
+        for limit, unit in zip(LIMITS, ("pW", "nW", "uW", "mW")):
+            self.assertEqual(format_power(limit), f"1000.00 {unit}")
+            self.assertEqual(format_power(math.nextafter(limit, 0.0)), f"1000.00 {unit}")
+
+    def test_values_just_past_a_limit_move_up_one_unit(self):
+        self.assertEqual(format_power(1.0000000000000003e-09), "1.00 nW")
+        for limit, unit in zip(LIMITS, ("nW", "uW", "mW", "W")):
+            self.assertEqual(format_power(math.nextafter(limit, 1.0e3)), f"1.00 {unit}")
+
+    def test_out_of_range_and_negative_readings(self):
+        self.assertEqual(format_power(5e-14), "0.05 pW")
+        self.assertEqual(format_power(2.5), "2.50 W")
+        self.assertEqual(format_power(-3e-6), "-3.00 uW")
+
+
+class FastArrayTests(unittest.TestCase):
+    def setUp(self):
+        self.logic = TLPMLogic()
+        self.emitted = []
+        self.info = []
+        self.logic.sig_power.connect(self.emitted.append)
+        self.logic.sig_info.connect(self.info.append)
+
+    def test_fast_array_mode_is_opt_in(self):
+        self.assertFalse(self.logic.fast_array)
+
+    def test_bursts_carry_unwrapped_timestamps(self):
+        self.logic.hardware = FakeFastArrayHardware([
+            ([2**32 - 20, 2**32 - 10], [1e-3, 2e-3]),
+            ([5, 15], [3e-3, 4e-3]),
+        ])
+        self.assertTrue(self.logic._start_power_array())
+        self.logic.read_power_array()
+        self.logic.read_power_array()
+
+        ticks = np.concatenate([t for t, _ in self.emitted])
+        powers = np.concatenate([p for _, p in self.emitted])
+        np.testing.assert_array_equal(ticks, [0, 10, 25, 35])
+        np.testing.assert_allclose(powers, [1e-3, 2e-3, 3e-3, 4e-3], rtol=1e-6)
+
+    def test_reset_errors_are_reported_not_raised(self):
+        self.logic.hardware = FakeFastArrayHardware([])
+        self.logic._stop_power_array()
+        self.assertTrue(any("reset rejected" in line for line in self.info))
+
+    def test_driver_errors_end_the_read_loop(self):
+        def failing_read():
+            raise NameError(b"read failed")
+
+        self.logic._read = failing_read
+        self.logic._read_tick()
+        self.assertTrue(any("read failed" in line for line in self.info))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,9 @@
 from PyQt6 import QtCore
-import time
 import ctypes
+import time
+import numpy as np
 # from scipy.io import savemat
-from ctypes import cdll, c_long, c_ulong, c_uint32, byref, create_string_buffer, c_bool, c_char_p, c_int, c_int16, c_double, sizeof, c_voidp
+from ctypes import cdll, c_long, c_ulong, c_uint16, c_uint32, byref, create_string_buffer, c_bool, c_int, c_int16, c_double, c_float, sizeof, c_voidp
 from .tlpm_hardware import TLPM_Hardware
 
 
@@ -16,6 +17,9 @@ class TLPMLogic(QtCore.QThread):
         self.is_connected = False
         self.reset_flags()
         self.freq = 20
+        # opt-in: PM103-class meters stream 200-sample bursts at their own rate;
+        # freq and the meter's averaging do not apply in that mode
+        self.fast_array = False
 
     def pass_info(self, info):
         self.sig_info.emit(info)
@@ -41,20 +45,19 @@ class TLPMLogic(QtCore.QThread):
 
         for i in range(0, deviceCount.value):
             tlPM.getRsrcName(c_int(i), resourceName)
-            self.pass_info(str(c_char_p(resourceName.raw).value))
+            self.pass_info(resourceName.value.decode(errors="replace"))
             break
         tlPM.close()
 
         # Create a new string buffer with the retrieved resource name
-        resource_string = c_char_p(resourceName.raw).value
+        resource_string = resourceName.value
         new_resourceName = create_string_buffer(resource_string)
 
         self.hardware = TLPM_Hardware()
         self.hardware.open(new_resourceName, c_bool(True), c_bool(True))
         message = create_string_buffer(1024)
         self.hardware.getCalibrationMsg(message)
-        info = c_char_p(message.raw).value
-        self.pass_info(str(info))
+        self.pass_info(message.value.decode(errors="replace"))
         self.sig_connect.emit(True)
         self.is_connected = True
 
@@ -77,10 +80,92 @@ class TLPMLogic(QtCore.QThread):
         self.sig_power.emit(power.value)
         return power.value
 
+    def read_power_array(self):
+        # one USB transfer returns up to 200 timestamp/value pairs, emitted as
+        # (timestamps, powers): raw meter ticks counted from the first sample
+        # of this run (uint32 wrap-around unfolded) and float64 powers
+        count = c_uint16()
+        self.hardware.getNextFastArrayMeasurement(byref(count), self._array_timestamps, self._array_values)
+        if count.value:
+            stamps = np.frombuffer(self._array_timestamps, dtype=np.uint32, count=count.value)
+            if self._last_stamp is None:
+                self._last_stamp = stamps[0]
+            # uint32 differences are taken modulo 2**32, so a counter wrap
+            # between or inside bursts still gives the right step
+            steps = np.diff(stamps, prepend=self._last_stamp).astype(np.float64)
+            ticks = self._last_tick + np.cumsum(steps)
+            self._last_stamp = stamps[-1]
+            self._last_tick = ticks[-1]
+            values = np.frombuffer(self._array_values, dtype=np.float32, count=count.value)
+            self.sig_power.emit((ticks, values.astype(np.float64)))
+
+    def _start_power_array(self):
+        # fast array mode exists on PM103-class meters only; older DLLs lack
+        # the call (AttributeError), other meters reject it (NameError)
+        try:
+            self.hardware.confPowerFastArrayMeasurement()
+        except (AttributeError, NameError) as e:
+            self.pass_info(f"Fast array mode unavailable, reading per sample: {e}")
+            return False
+        self._array_timestamps = (c_uint32 * 200)()
+        self._array_values = (c_float * 200)()
+        self._last_stamp = None
+        self._last_tick = 0.0
+        return True
+
+    def _stop_power_array(self):
+        try:
+            self.hardware.resetFastArrayMeasurement()
+        except (AttributeError, NameError) as e:
+            self.pass_info(f"Resetting fast array mode failed: {e}")
+
+    def _read_power_buffered(self):
+        # per-sample mode: readings are collected here and sent to the GUI as
+        # one chunk per 32 samples or 33 ms, whichever comes first
+        self._chunk[self._chunk_n] = self.get_power()
+        self._chunk_n += 1
+        now = time.monotonic()
+        if self._chunk_n == self._chunk.size or now - self._chunk_t >= 0.033:
+            self._flush_chunk(now)
+
+    def _flush_chunk(self, now):
+        if self._chunk_n:
+            self.sig_power.emit(self._chunk[:self._chunk_n].copy())
+        self._chunk_n = 0
+        self._chunk_t = now
+
     def read_indefinitely(self):
-        while not self.receieved_stop:
-            self.read_power()
-            time.sleep(1/self.freq)
+        # a timer on this thread's event loop paces the reads; stop_indef only
+        # sets receieved_stop, the next tick then leaves the loop
+        batched = self.fast_array and self._start_power_array()
+        if batched:
+            self._read = self.read_power_array
+        else:
+            self._chunk = np.empty(32)
+            self._chunk_n = 0
+            self._chunk_t = time.monotonic()
+            self._read = self._read_power_buffered
+        timer = QtCore.QTimer()
+        timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        timer.setInterval(max(1, round(1000/self.freq)))
+        timer.timeout.connect(self._read_tick, QtCore.Qt.ConnectionType.DirectConnection)
+        timer.start()
+        self.exec()
+        timer.stop()
+        if batched:
+            self._stop_power_array()
+        else:
+            self._flush_chunk(time.monotonic())
+
+    def _read_tick(self):
+        if self.receieved_stop:
+            self.quit()
+            return
+        try:
+            self._read()
+        except NameError as e:  # driver error status; end the run cleanly
+            self.pass_info(f"Reading power failed: {e}")
+            self.quit()
 
     def get_power(self):
         power = c_double()
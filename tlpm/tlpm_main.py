@@ -1,9 +1,32 @@
 from PyQt6 import QtWidgets, uic, QtCore
+import math
 import sys
 from .tlpm_logic import TLPMLogic
 import numpy as np
 import pyqtgraph as pg
 
+# display units for the power label, one per factor of 1000
+UNITS = ('pW', 'nW', 'uW', 'mW', 'W')
+SCALES = (1e12, 1e9, 1e6, 1e3, 1.0)
+LIMITS = (1e-9, 1e-6, 1e-3, 1.0)  # inclusive upper end of each unit but W
+
+
+def format_power(power):
+    """Label text for a power in W: (1e-12, 1e-9] -> pW, ..., (1e-3, 1] -> mW, above -> W.
+
+    Zero reads as mW and non-finite readings are shown unscaled in W.
+    """
+    mag = abs(power)
+    if mag == 0 or not math.isfinite(mag):
+        lv = 3 if mag == 0 else 4
+    else:
+        lv = min(4, max(0, math.ceil(math.log10(mag) / 3) + 3))
+        # log10 may round a value just past a decade onto it; settle exactly
+        if lv < 4 and mag > LIMITS[lv]:
+            lv += 1
+        elif lv > 0 and mag <= LIMITS[lv - 1]:
+            lv -= 1
+    return f"{power * SCALES[lv]:.2f} {UNITS[lv]}"
 
 class TLPM(QtWidgets.QWidget):
     def __init__(self):
@@ -11,7 +34,21 @@ class TLPM(QtWidgets.QWidget):
         uic.loadUi("tlpm/tlpm.ui", self)
         self.logic = TLPMLogic()
         self.connect_sig_slot()
-        self.power_log = np.zeros(1000)
+        # twice the 1000-sample window: samples are appended at _head and the
+        # newest half is moved to the front when full, so the plotted window is
+        # always the view power_log[_head - 1000:_head] (starts as 1000 zeros).
+        # time_log holds the x of each sample: its index, or the meter's raw
+        # timestamp for fast array bursts
+        self.power_log = np.zeros(2000)
+        self.time_log = np.zeros(2000)
+        self._x_unit = None
+        self.reset_plot()
+
+        # one persistent curve, redrawn at most ~30 Hz whatever the sample rate
+        self.curve = self.input1_PlotWidget.getPlotItem().plot(pen=pg.mkPen((255, 255, 255), width=3))
+        self.repaint_timer = QtCore.QTimer(self)
+        self.repaint_timer.timeout.connect(self.flush_plot)
+        self.repaint_timer.start(33)
 
     def connect_sig_slot(self):
         self.connect_button.clicked.connect(self.connect)
@@ -29,27 +66,45 @@ class TLPM(QtWidgets.QWidget):
         else:
             self.label_on_off.setText("OFF")
 
+    def reset_plot(self):
+        self.power_log.fill(0)
+        self.time_log[:1000] = np.arange(-1000, 0)
+        self._head = 1000
+        self._next_x = 0  # x of the next per-sample reading
+        self._dirty = True  # new samples since the last repaint
+
     def update_power(self, power):
-        self.power_log[0:-1] = self.power_log[1:]
-        self.power_log[-1] = power
-        pen1 = pg.mkPen((255, 255, 255), width=3)
-        self.input1_PlotWidget.getPlotItem().plot(self.power_log, clear=True, pen=pen1)
-
-        units = ['pw', 'nW', 'uW', 'mW', 'W']
-        lv = 3
-        if 1e-12 < power and power <= 1e-9:
-            power = power*1e12
-            lv = 0
-        elif 1e-9 < power and power <= 1e-6:
-            power = power*1e9
-            lv = 1
-        elif 1e-6 < power and power <= 1e-3:
-            power = power*1e6
-            lv = 2
-        elif 1e-3 < power and power <= 1e0:
-            power = power*1e3
-            lv = 3
-        self.input1_label.setText(f"{power:.2f} {units[lv]}")
+        # one reading, a chunk of readings, or a fast array burst given as
+        # (raw meter timestamps, readings)
+        if isinstance(power, tuple):
+            xs, samples = power
+            x_unit = "meter ticks"
+        else:
+            samples = np.atleast_1d(power)
+            xs = self._next_x + np.arange(samples.size)
+            x_unit = "sample"
+        xs, samples = xs[-1000:], samples[-1000:]
+        self._next_x = xs[-1] + 1
+        if x_unit != self._x_unit:
+            self._x_unit = x_unit
+            self.input1_PlotWidget.getPlotItem().setLabel('bottom', x_unit)
+        n = samples.size
+        if self._head + n > self.power_log.size:
+            self.power_log[:1000] = self.power_log[self._head - 1000:self._head]
+            self.time_log[:1000] = self.time_log[self._head - 1000:self._head]
+            self._head = 1000
+        self.power_log[self._head:self._head + n] = samples
+        self.time_log[self._head:self._head + n] = xs
+        self._head += n
+        self._dirty = True
+        self.input1_label.setText(format_power(float(samples[-1])))
+
+    def flush_plot(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        window = slice(self._head - 1000, self._head)
+        self.curve.setData(self.time_log[window], self.power_log[window])
 
     def update_info(self, info):
         self.info_label.setText(info)
@@ -75,6 +130,8 @@ class TLPM(QtWidgets.QWidget):
         self.logic.start()
 
     def read_indef(self):
+        # each run restarts the x axis (fast array timestamps count from 0)
+        self.reset_plot()
         self.logic.freq = self.freq_doubleSpinBox.value()
         self.logic.do_read_indefinitely = True
         self.logic.start()